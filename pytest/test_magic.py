@@ -1,9 +1,108 @@
 """
 Unit test for xdis.magics
 """
+import pytest
 from xdis import IS_GRAAL
-from xdis.magics import MAGIC, sysinfo2magic
+from xdis.magics import (
+    MAGIC,
+    add_magic_from_int,
+    by_magic,
+    by_version,
+    canonic_python_version,
+    int2magic,
+    magic2int,
+    magic_int2tuple,
+    magicint2version,
+    magics,
+    py_str2tuple,
+    python_versions,
+    sysinfo2magic,
+    versions,
+)
 
 
 def test_magic():
     assert sysinfo2magic() == MAGIC, (sysinfo2magic(), MAGIC)
+
+
+def test_add_magic_from_int():
+    magic_int = 9999
+    assert magic_int not in magicint2version
+    try:
+        add_magic_from_int(magic_int, "9.9test")
+        assert magicint2version[magic_int] == "9.9test"
+        assert versions[int2magic(magic_int)] == "9.9test"
+    finally:
+        del magicint2version[magic_int]
+        del versions[int2magic(magic_int)]
+
+
+@pytest.mark.parametrize(
+    "mapping, key",
+    [
+        (by_magic, MAGIC),
+        (magics, "2.7"),
+        (canonic_python_version, "2.7.18"),
+    ],
+)
+def test_published_tables_are_read_only(mapping, key):
+    with pytest.raises(TypeError):
+        mapping[key] = mapping[key]
+    with pytest.raises(TypeError):
+        mapping["new-key"] = mapping[key]
+
+
+def test_by_magic_values_are_frozensets():
+    for magic, version_set in by_magic.items():
+        assert isinstance(version_set, frozenset), magic
+        for version in version_set:
+            assert version in by_version
+
+
+def test_magic_tables():
+    for magic_int, version in magicint2version.items():
+        magic = int2magic(magic_int)
+        assert magic2int(magic) == magic_int
+        assert versions[magic] in by_magic[magic]
+    assert int2magic(39170) == b"\x02\x99\x99\x00"
+    assert int2magic(62211) == b"\x03\xf3\r\n"
+
+    for version, canonic in canonic_python_version.items():
+        assert magics[version] == magics[canonic]
+    assert python_versions == frozenset(canonic_python_version)
+
+    # Insertion order is part of what callers iterate over.
+    assert list(magics)[:4] == ["1.0", "1.1", "1.3", "1.4"]
+    assert list(canonic_python_version)[:3] == ["1.5.1", "1.5.2", "2.0.1"]
+
+
+@pytest.mark.parametrize(
+    "version, expect",
+    [
+        ("2.7", (2, 7)),
+        ("3.6pypy", (3, 6)),
+        ("2.5dropbox", (2, 5)),
+        ("3.8.0rc1+", (3, 8, 0)),
+        ("3.9.15pypy", (3, 9, 15)),
+        ("3.11a7e", (3, 11)),
+        # Not a known version string itself, but valid once the
+        # suffix is stripped.
+        ("3.5.2dropbox", (3, 5, 2)),
+    ],
+)
+def test_py_str2tuple(version, expect):
+    assert py_str2tuple(version) == expect
+
+
+def test_py_str2tuple_unknown():
+    with pytest.raises(RuntimeError):
+        py_str2tuple("bogus")
+
+
+def test_magic_int2tuple():
+    for magic_int, version in magicint2version.items():
+        assert magic_int2tuple(magic_int) == py_str2tuple(version)
+    assert magic_int2tuple(62211) == (2, 7)
+    assert magic_int2tuple(3413) == (3, 8, 0)
+    with pytest.raises(KeyError):
+        magic_int2tuple(1)
@@ -1,6 +1,9 @@
 import dis
+from types import SimpleNamespace
 
 from xdis import IS_PYPY, PYTHON_VERSION_TRIPLE, get_opcode
+from xdis.op_imports import remap_opcodes
+from xdis.opcodes.base import opcode_check
 
 
 def test_opcode():
@@ -60,5 +63,26 @@ def test_opcode():
         )
 
 
+def test_opcode_check():
+    # finalize_opcodes() only runs this check under "python -X dev".
+    opc = get_opcode(PYTHON_VERSION_TRIPLE, IS_PYPY)
+    opcode_check(vars(opc))
+
+
+def test_opname_is_tuple():
+    opc = get_opcode(PYTHON_VERSION_TRIPLE, IS_PYPY)
+    assert isinstance(opc.opname, tuple)
+
+    # Remap a copy, since remap_opcodes() changes its argument in place.
+    opc_copy = SimpleNamespace(**vars(opc))
+    pop_top, nop = opc.opmap["POP_TOP"], opc.opmap["NOP"]
+    remapped = remap_opcodes(opc_copy, {"POP_TOP": nop, "NOP": pop_top})
+    assert isinstance(remapped.opname, tuple)
+    assert remapped.opname[nop] == "POP_TOP"
+    assert isinstance(opc.opname, tuple)
+
+
 if __name__ == "__main__":
     test_opcode()
+    test_opcode_check()
+    test_opname_is_tuple()
@@ -109,7 +109,7 @@ def is_pypy(magic_int, filename):
     # PyPy 3.8 starts pyston's trend of using Python's magic numbers.
     if magic_int in (3413, 3414) and filename.endswith("pypy38.pyc"):
         return True
-    return magic_int in ((62211 + 7, 3180 + 7) + PYPY3_MAGICS)
+    return magic_int in (62211 + 7, 3180 + 7) or magic_int in PYPY3_MAGICS
 
 
 def load_file(filename, out=sys.stdout):
@@ -19,8 +19,8 @@ Everything you ever wanted to know about Python versions and their
 magic numbers. And a little bit more...
 
 by_magic: in this dictionary, the key is a magic byte string like
-# b'\x03\xf3\r\n' and its value is a set of canonic version strings, like
-# '2.7'
+# b'\x03\xf3\r\n' and its value is a frozenset of canonic version strings,
+# like '2.7'
 
 by_version: in this dictionary, the key is a canonic version string like '2.7,
 and its value is a magic byte string like b'\x03\xf3\r\n' canonic
@@ -32,23 +32,32 @@ and the value is its canonic versions string, e.g. '2.7'
 PYTHON_MAGIC_INT: The magic integer for the current running Python interpreter
 """
 
+import builtins
+import functools
+import platform
 import re
 import struct
 import sys
-from typing import Dict, Set
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Set
 
 from xdis.version_info import IS_GRAAL, IS_PYPY, version_tuple_to_str
 
-PYPY3_MAGICS = (48, 64, 112, 160, 192, 240, 244, 256, 336, 384)
-GRAAL3_MAGICS = (21150, 21280)
+PYPY3_MAGICS = frozenset((48, 64, 112, 160, 192, 240, 244, 256, 336, 384))
+GRAAL3_MAGICS = frozenset((21150, 21280))
 
 
-def add_magic_from_int(magic_int, version):
-    magicint2version[magic_int] = version
-    versions[int2magic(magic_int)] = version
+# Precompiled struct for the 2-byte little-endian magic followed by "\r\n".
+_MAGIC_STRUCT = struct.Struct("<Hcc")
+
+# Python 1.0 and 1.1 do not end their magic in "\r\n".
+_SPECIAL_MAGICS = {
+    39170: b"\x02\x99\x99\x00",
+    39171: b"\x03\x99\x99\x00",
+}
 
 
-def int2magic(magic_int):
+def int2magic(magic_int: int) -> bytes:
     """Given a magic int like 62211, compute the corresponding magic byte string
      b'\x03\xf3\r\n' using the conversion method that does this.
 
@@ -56,14 +65,9 @@ def int2magic(magic_int):
     for known magic_int's.
     """
 
-    if magic_int in (39170, 39171):
-        return struct.pack("<H", magic_int) + b"\x99\x00"
-    if sys.version_info >= (3, 0):
-        return struct.pack(
-            "<Hcc", magic_int, bytes("\r", "utf-8"), bytes("\n", "utf-8")
-        )
-    else:
-        return struct.pack("<Hcc", magic_int, "\r", "\n")
+    if magic_int in _SPECIAL_MAGICS:
+        return _SPECIAL_MAGICS[magic_int]
+    return _MAGIC_STRUCT.pack(magic_int, b"\r", b"\n")
 
 
 def magic2int(magic: bytes) -> int:
@@ -75,21 +79,33 @@ def magic2int(magic: bytes) -> int:
     for knonwn magic_int's.
 
     """
-    return struct.unpack("<Hcc", magic)[0]
+    return _MAGIC_STRUCT.unpack(magic)[0]
 
 
-def __by_version(magic_versions: Dict[bytes, str]) -> dict:
-    for m, version in list(magic_versions.items()):
-        if m not in by_magic:
-            by_magic[m] = {version}
+def _add_magics(magic_table: tuple) -> None:
+    """Fill magicint2version and versions from (magic_int, version) pairs."""
+    for magic_int, version in magic_table:
+        version = sys.intern(version)
+        magicint2version[magic_int] = version
+        if magic_int in _SPECIAL_MAGICS:
+            versions[_SPECIAL_MAGICS[magic_int]] = version
         else:
-            by_magic[m].add(version)
+            versions[_MAGIC_STRUCT.pack(magic_int, b"\r", b"\n")] = version
+
+
+def add_magic_from_int(magic_int, version):
+    _add_magics(((magic_int, version),))
+
+
+def __by_version(magic_versions: Dict[bytes, str]) -> dict:
+    for m, version in magic_versions.items():
+        _by_magic.setdefault(m, set()).add(version)
         by_version[version] = m
     return by_version
 
 
 # Documentation for the below variables is above.
-by_magic: Dict[bytes, Set] = {}
+_by_magic: Dict[bytes, Set[str]] = {}
 by_version: Dict[str, bytes] = {}
 magicint2version: Dict[int, str] = {}
 versions: Dict[bytes, str] = {}
@@ -133,400 +149,398 @@ PYTHON_MAGIC_INT = magic2int(MAGIC)
 # And more recently:
 # https://github.com/google/pytype/blob/main/pytype/pyc/magic.py
 
-#                  magic,  canonic version number
-add_magic_from_int(39170, "1.0")
-add_magic_from_int(39171, "1.1")  # covers 1.2 as well
-add_magic_from_int(11913, "1.3")
-add_magic_from_int(5892, "1.4")
-
-# 1.5, 1.5.1, 1.5.2
-add_magic_from_int(20121, "1.5")  # 1.5.1, 1.5.2
-add_magic_from_int(50428, "1.6")  # 1.6
-
-add_magic_from_int(50823, "2.0")  # 2.0, 2.0.1
-add_magic_from_int(60202, "2.1")  # 2.1, 2.1.1, 2.1.2
-add_magic_from_int(60717, "2.2")  # 2.2
-
-# Two magics one version!
-add_magic_from_int(62011, "2.3a0")
-add_magic_from_int(62021, "2.3a0")  # two distinct magics for the same release
-
-add_magic_from_int(62041, "2.4a0")
-add_magic_from_int(62051, "2.4a3")
-add_magic_from_int(62061, "2.4b1")
-add_magic_from_int(62071, "2.5a0")
-add_magic_from_int(62081, "2.5a0")  # ast-branch
-add_magic_from_int(62091, "2.5a0")  # with
-add_magic_from_int(62092, "2.5a0")  # changed WITH_CLEANUP opcode
-add_magic_from_int(62101, "2.5b3")  # fix wrong code: for x, in ...
-add_magic_from_int(62111, "2.5b3")  # fix wrong code: x += yield
-
-# Fix wrong lnotab with for loops and storing constants that should
-# have been removed
-add_magic_from_int(62121, "2.5c1")
-
-# Fix wrong code: "for x, in ..." in listcomp/genexp
-add_magic_from_int(62131, "2.5c2")
-
-# Dropbox-modified Python 2.5 used in versions 1.1x and before of Dropbox
-add_magic_from_int(62135, "2.5dropbox")
-
-add_magic_from_int(62151, "2.6a0")  # peephole optimizations & STORE_MAP
-add_magic_from_int(62161, "2.6a1")  # WITH_CLEANUP optimization
-
-# Optimize list comprehensions/change LIST_APPEND
-add_magic_from_int(62171, "2.7a0")
-
-# Optimize conditional branches: introduce POP_JUMP_IF_FALSE and
-# POP_JUMP_IF_TRUE
-add_magic_from_int(62181, "2.7a0+1")
-
-add_magic_from_int(62191, "2.7a0+2")  # introduce SETUP_WITH
-add_magic_from_int(62201, "2.7a0+3")  # introduce BUILD_SET
-add_magic_from_int(62211, "2.7")  # introduce MAP_ADD and SET_ADD
-
-add_magic_from_int(2657, "2.7pyston-0.6.1")
-
-# PyPy including pypy-2.6.1, pypy-5.0.1 PyPy adds 7 to the corresponding CPython number
-add_magic_from_int(62211 + 7, "2.7pypy")
-
-add_magic_from_int(3000, "3.000")
-add_magic_from_int(3010, "3.000+1")  # removed UNARY_CONVERT
-add_magic_from_int(3020, "3.000+2")  # added BUILD_SET
-add_magic_from_int(3030, "3.000+3")  # added keyword-only parameters
-add_magic_from_int(3040, "3.000+4")  # added signature annotations
-add_magic_from_int(3050, "3.000+5")  # print becomes a function
-add_magic_from_int(3060, "3.000+6")  # PEP 3115 metaclass syntax
-add_magic_from_int(3061, "3.000+7")  # string literals become unicode
-add_magic_from_int(3071, "3.000+8")  # PEP 3109 raise changes
-add_magic_from_int(3081, "3.000+9")  # PEP 3137 make __file__ and __name__ unicode
-add_magic_from_int(3091, "3.000+10")  # kill str8 interning
-add_magic_from_int(3101, "3.000+11")  # merge from 2.6a0, see 62151
-add_magic_from_int(3103, "3.000+12")  # __file__ points to source file
-add_magic_from_int(3111, "3.0a4")  # WITH_CLEANUP optimization
-add_magic_from_int(3131, "3.0a5")  # lexical exception stacking, including POP_EXCEPT
-add_magic_from_int(3141, "3.1a0")  # optimize list, set and dict comprehensions
-add_magic_from_int(3151, "3.1a0+")  # optimize conditional branches
-add_magic_from_int(3160, "3.2a0")  # add SETUP_WITH
-add_magic_from_int(3170, "3.2a1")  # add DUP_TOP_TWO, remove DUP_TOPX and ROT_FOUR
-add_magic_from_int(3180, "3.2a2")  # 3.2a2 (add DELETE_DEREF)
-
-# Python 3.2.5 - PyPy 2.3.4 PyPy adds 7 to the corresponding CPython
-# number
-add_magic_from_int(3180 + 7, "3.2pypy")
-
-add_magic_from_int(3190, "3.3a0")  # __class__ super closure changed
-add_magic_from_int(3200, "3.3a0+")  # __qualname__ added
-add_magic_from_int(3220, "3.3a1")  # changed PEP 380 implementation
-
-# Added size modulo 2**32 to the pyc header
-# NOTE: 3.3a2 is our name, other places call it 3.3
-# but most 3.3 versions are 3.3a4 which comes next.
-# FIXME: figure out what the history is and
-# what the right thing to do if this isn't it.
-add_magic_from_int(3210, "3.3a2")
-add_magic_from_int(3230, "3.3a4")  # revert changes to implicit __class__ closure
-
-# Evaluate positional default arg keyword-only defaults
-add_magic_from_int(3250, "3.4a1")
-
-# Add LOAD_CLASSDEREF; add_magic_from_int locals, f class to override free vars
-add_magic_from_int(3260, "3.4a1+1")
-
-add_magic_from_int(3270, "3.4a1+2")  # various tweaks to the __class__ closure
-add_magic_from_int(3280, "3.4a1+3")  # remove implicit class argument
-add_magic_from_int(3290, "3.4a4")  # changes to __qualname__ computation
-add_magic_from_int(3300, "3.4a4+")  # more changes to __qualname__ computation
-add_magic_from_int(3310, "3.4rc2")  # alter __qualname__ computation
-add_magic_from_int(3320, "3.5a0")  # matrix multiplication operator
-add_magic_from_int(3330, "3.5b1")  # pep 448: additional unpacking generalizations
-add_magic_from_int(3340, "3.5b2")  # fix dictionary display evaluation order #11205
-add_magic_from_int(3350, "3.5")  # add GET_YIELD_FROM_ITER opcode #24400 (also 3.5b2)
-add_magic_from_int(
-    3351, "3.5.2"
-)  # fix BUILD_MAP_UNPACK_WITH_CALL opcode #27286; 3.5.3, 3.5.4, 3.5.5
-add_magic_from_int(3360, "3.6a0")  # add FORMAT_VALUE opcode #25483
-add_magic_from_int(3361, "3.6a0+1")  # lineno delta of code.co_lnotab becomes signed
-add_magic_from_int(3370, "3.6a1")  # 16 bit wordcode
-add_magic_from_int(3371, "3.6a1+1")  # add BUILD_CONST_KEY_MAP opcode #27140
-add_magic_from_int(
-    3372, "3.6a1+2"
-)  # MAKE_FUNCTION simplification, remove MAKE_CLOSURE #27095
-add_magic_from_int(3373, "3.6b1")  # add BUILD_STRING opcode #27078
-add_magic_from_int(
-    3375, "3.6b1+1"
-)  # add SETUP_ANNOTATIONS and STORE_ANNOTATION opcodes #27985
-add_magic_from_int(
-    3376, "3.6b1+2"
-)  # simplify CALL_FUNCTION* & BUILD_MAP_UNPACK_WITH_CALL
-add_magic_from_int(3377, "3.6b1+3")  # set __class__ cell from type.__new__ #23722
-add_magic_from_int(3378, "3.6b2")  # add BUILD_TUPLE_UNPACK_WITH_CALL #28257
-
-# more thorough __class__ validation #23722
-add_magic_from_int(3379, "3.6rc1")
-
-# add LOAD_METHOD and CALL_METHOD opcodes #26110
-add_magic_from_int(3390, "3.7.0alpha0")
-
-# update GET_AITER #31709
-add_magic_from_int(3391, "3.7.0alpha3")
-
-# Initial PEP 552 - Deterministic pycs #31650
-# Additional word in header and possibly no timestamp
-add_magic_from_int(3392, "3.7.0beta2")
-
-# Final PEP 552: timestamp + size field or no timestamp + SipHash
-# remove STORE_ANNOTATION opcode #3255
-add_magic_from_int(3393, "3.7.0beta3")
-
-# restored docstring as the first stmt in the body; this might
-# affect the first line number #32911
-add_magic_from_int(3394, "3.7.0")
-
-# move frame block handling to compiler #17611
-add_magic_from_int(3400, "3.8.0a1")
-
-# add END_ASYNC_FOR #33041
-add_magic_from_int(3401, "3.8.0a3+")
-
-# PEP570 Python Positional-Only Parameters #36540
-add_magic_from_int(3410, "3.8.0a1+")
-
-# Reverse evaluation order of key: value in dict comprehensions
-# #35224
-add_magic_from_int(3411, "3.8.0b2+")
-
-# Swap the position of positional args and positional only args in
-# ast.arguments #37593
-add_magic_from_int(3412, "3.8.0beta2")
-
-# Fix "break" and "continue" in "finally" #37830
-add_magic_from_int(3413, "3.8.0rc1+")
-
-# add LOAD_ASSERTION_ERROR #34880
-add_magic_from_int(3420, "3.9.0a0")
-
-# simplified bytecode for with blocks #32949
-add_magic_from_int(3421, "3.9.0a0")
-
-# Remove BEGIN_FINALLY, END_FINALLY, CALL_FINALLY, POP_FINALLY bytecodes #33387
-add_magic_from_int(3422, "3.9.0alpha1")
-
-# add IS_OP, CONTAINS_OP and JUMP_IF_NOT_EXC_MATCH bytecodes #39156
-add_magic_from_int(3423, "3.9.0a0")
-
-# simplify bytecodes for *value unpacking
-add_magic_from_int(3424, "3.9.0a2")
-
-# simplify bytecodes for **value unpacking
-add_magic_from_int(3425, "3.9.0beta5")
-
-# Make 'annotations' future by default
-add_magic_from_int(3430, "3.10a1")
-
-# New line number table format -- PEP 626
-add_magic_from_int(3431, "3.10a1")
-
-# Function annotation for MAKE_FUNCTION is changed from dict to tuple bpo-42202
-add_magic_from_int(3432, "3.10a2")
-
-# RERAISE restores f_lasti if oparg != 0
-add_magic_from_int(3433, "3.10a2")
-add_magic_from_int(3434, "3.10a6")
-add_magic_from_int(3435, "3.10a7")
-add_magic_from_int(3438, "3.10b1")
-add_magic_from_int(3439, "3.10.0rc2")
-
-add_magic_from_int(3450, "3.11a1a")
-add_magic_from_int(3451, "3.11a1b")
-add_magic_from_int(3452, "3.11a1c")
-add_magic_from_int(3453, "3.11a1d")
-add_magic_from_int(3454, "3.11a1e")
-add_magic_from_int(3455, "3.11a1f")
-add_magic_from_int(3457, "3.11a1g")
-add_magic_from_int(3458, "3.11a1h")
-add_magic_from_int(3459, "3.11a1i")
-add_magic_from_int(3460, "3.11a1j")
-add_magic_from_int(3461, "3.11a1k")
-add_magic_from_int(3462, "3.11a2")
-add_magic_from_int(3463, "3.11a3a")
-add_magic_from_int(3464, "3.11a3b")
-add_magic_from_int(3465, "3.11a4a")
-add_magic_from_int(3466, "3.11a4b")
-add_magic_from_int(3466, "3.11a4c")
-add_magic_from_int(3467, "3.11a4d")
-add_magic_from_int(3468, "3.11a4e")
-add_magic_from_int(3469, "3.11a4f")
-add_magic_from_int(3470, "3.11a4g")
-add_magic_from_int(3471, "3.11a4h")
-add_magic_from_int(3472, "3.11a4i")
-add_magic_from_int(3473, "3.11a4j")
-add_magic_from_int(3474, "3.11a4k")
-add_magic_from_int(3475, "3.11a5a")
-add_magic_from_int(3476, "3.11a5b")
-add_magic_from_int(3477, "3.11a5c")
-add_magic_from_int(3478, "3.11a5d")
-add_magic_from_int(3479, "3.11a5e")
-add_magic_from_int(3480, "3.11a5e")
-add_magic_from_int(3481, "3.11a5f")
-add_magic_from_int(3482, "3.11a5g")
-add_magic_from_int(3483, "3.11a5h")
-add_magic_from_int(3484, "3.11a5i")
-add_magic_from_int(3485, "3.11a5j")
-add_magic_from_int(3486, "3.11a6a")
-add_magic_from_int(3487, "3.11a6b")
-add_magic_from_int(3488, "3.11a6c")
-add_magic_from_int(3489, "3.11a6d")
-add_magic_from_int(3490, "3.11a6d")
-add_magic_from_int(3491, "3.11a7a")
-add_magic_from_int(3492, "3.11a7b")
-add_magic_from_int(3493, "3.11a7c")
-add_magic_from_int(3494, "3.11a7d")
-add_magic_from_int(3495, "3.11a7e")
-add_magic_from_int(3531, "3.12.0rc2")
-
-# Weird ones
-# WTF? Python 3.2.5 and PyPy have weird magic numbers
-
-add_magic_from_int(48, "3.2a2")
-add_magic_from_int(64, "3.3pypy")
-add_magic_from_int(112, "3.5pypy")  # pypy3.5-c-jit-latest
-add_magic_from_int(160, "3.6.1pypy")  # '3.6.1 ... PyPy 7.1.0-beta0'
-add_magic_from_int(192, "3.6pypy")  # '3.6.9 ... PyPy 7.1.0-beta0'
-add_magic_from_int(224, "3.7pypy")  # PyPy 3.7.9-beta0
-add_magic_from_int(240, "3.7pypy")  # PyPy 3.7.9-beta0
-add_magic_from_int(256, "3.8pypy")  # PyPy 3.8.15
-add_magic_from_int(336, "3.9pypy")  # PyPy 3.9.15, PyPy 3.9.17
-add_magic_from_int(384, "3.10pypy")  # PyPy 3.10.12
-
-# NOTE: This is JVM bytecode not Python bytecode
-add_magic_from_int(21150, "3.8.5Graal")
-
-# Graal Java 21.0.2
-add_magic_from_int(21280, "3.10.8Graal")
-
-
-add_magic_from_int(1011, "2.7.1b3Jython")  # jython
-add_magic_from_int(22138, "2.7.7Pyston")  # 2.7.8pyston, pyston-0.6.0
-
-magics = __by_version(versions)
-magics["3.8.12pypy"] = magics["3.8.0rc1+"]
-magics["3.9.15pypy"] = magics["3.9.0alpha1"]
-magics["3.9.16pypy"] = magics["3.9.0alpha1"]
-
-# From a Python version given in sys.info, e.g. 3.6.1,
-# what is the "canonic" version number, e.g. '3.6.0rc1'
-canonic_python_version = {}
-
-
-def add_canonic_versions(release_versions: str, canonic):
-    for version in release_versions.split():
-        canonic_python_version[version] = canonic
-        magics[version] = magics[canonic]
-
-
-add_canonic_versions("1.5.1 1.5.2", "1.5")
-add_canonic_versions("2.0.1", "2.0")
-add_canonic_versions("2.1.1 2.1.2 2.1.3", "2.1")
-add_canonic_versions("2.2.3", "2.2")
-add_canonic_versions("2.3 2.3.7", "2.3a0")
-add_canonic_versions("2.4 2.4.0 2.4.1 2.4.2 2.4.3 2.4.5 2.4.6", "2.4b1")
-add_canonic_versions("2.5 2.5.0 2.5.1 2.5.2 2.5.3 2.5.4 2.5.5 2.5.6", "2.5c2")
-add_canonic_versions("2.6 2.6.6 2.6.7 2.6.8 2.6.9", "2.6a1")
-add_canonic_versions(
-    "2.7.0 2.7.1 2.7.2 2.7.2 2.7.3 2.7.4 2.7.5 2.7.6 2.7.7 "
-    "2.7.8 2.7.9 2.7.10 2.7.11 2.7.12 2.7.13 2.7.14 2.7.15 "
-    "2.7.15candidate1 "
-    "2.7.16 "
-    "2.7.17rc1 2.7.17candidate1 2.7.17 2.7.18 2.7.18candidate1",
-    "2.7",
-)
-add_canonic_versions("3.0 3.0.0 3.0.1", "3.0a5")
-add_canonic_versions("3.1 3.1.0 3.1.1 3.1.2 3.1.3 3.1.4 3.1.5", "3.1a0+")
-add_canonic_versions("3.2 3.2.0 3.2.1 3.2.2 3.2.3 3.2.4 3.2.5 3.2.6", "3.2a2")
-add_canonic_versions(
-    "3.3 3.3.0 3.3.1 3.3.2 3.3.3 3.3.4 3.3.5 3.3.6 3.3.7rc1 3.3.7", "3.3a4"
-)
-add_canonic_versions(
-    "3.4 3.4.0 3.4.1 3.4.2 3.4.3 3.4.4 3.4.5 3.4.6 3.4.7 3.4.8 3.4.9 3.4.10", "3.4rc2"
-)
-add_canonic_versions("3.5 3.5.0 3.5.1", "3.5")
-add_canonic_versions(
-    "3.5.2 3.5.3 3.5.4 3.5.5 3.5.6 3.5.7 3.5.8 3.5.9 " "3.5.10", "3.5.2"
-)
-add_canonic_versions(
-    "3.6b2 3.6 3.6.0 3.6.1 3.6.2 3.6.3 3.6.4 3.6.5 3.6.6 3.6.7 3.6.8 "
-    "3.6.9 3.6.10 3.6.11 3.6.12 3.6.13 3.6.14 3.6.15",
-    "3.6rc1",
-)
-
-add_canonic_versions("3.7b1", "3.7.0beta3")
-add_canonic_versions("3.8a1", "3.8.0beta2")
-
-add_canonic_versions("2.7.10pypy 2.7.12pypy 2.7.13pypy 2.7.18pypy", "2.7pypy")
-add_canonic_versions("2.7.3b0Jython", "2.7.1b3Jython")
-add_canonic_versions("3.8.5Graal", "3.8.5Graal")
-add_canonic_versions("3.8.10Graal", "3.8.0rc1+")
-
-add_canonic_versions("3.2.5pypy", "3.2pypy")
-add_canonic_versions("3.3.5pypy", "3.3pypy")
-add_canonic_versions("3.5.3pypy", "3.5pypy")
-add_canonic_versions("3.6.9pypy", "3.6pypy")
-add_canonic_versions("3.7.0pypy 3.7.9pypy 3.7.10pypy 3.7.12pypy 3.7.13pypy", "3.7pypy")
-add_canonic_versions("3.8.0pypy 3.8.12pypy 3.8.13pypy 3.8.15pypy", "3.8.12pypy")
-add_canonic_versions("3.8.16pypy", "3.8pypy")
-add_canonic_versions("3.9.17pypy 3.9.18pypy", "3.9pypy")
-add_canonic_versions("3.10.12pypy 3.10.13pypy 3.10pypy", "3.10pypy")
-add_canonic_versions("2.7.8Pyston", "2.7.7Pyston")
-add_canonic_versions("3.7.0alpha3", "3.7.0alpha3")
-add_canonic_versions(
-    "3.7 3.7.0beta5 3.7.1 3.7.2 3.7.3 3.7.4 3.7.5 3.7.6 3.7.7 3.7.8 3.7.9 "
-    "3.7.10 3.7.11 3.7.12 3.7.13 3.7.14 3.7.15 3.7.16 3.7.17",
-    "3.7.0",
-)
-add_canonic_versions("3.8.0alpha0 3.8.0alpha3 3.8.0a0", "3.8.0a3+")
-add_canonic_versions(
-    "3.8b4 3.8.0candidate1 3.8 3.8.0 3.8.1 3.8.2 3.8.3 3.8.4 3.8.5 3.8.6 3.8.7 3.8.8 "
-    "3.8.9 3.8.10 3.8.11 3.8.12 3.8.13 3.8.14 3.8.15 3.8.16 3.8.17 3.8.18 3.8.19",
-    "3.8.0rc1+",
-)
-add_canonic_versions(
-    "3.9 3.9.0 3.9.0a1+ 3.9.0a2+ 3.9.0alpha1 3.9.0alpha2", "3.9.0alpha1"
-)
-add_canonic_versions(
-    "3.9 3.9.0 3.9.1 3.9.2 3.9.3 3.9.4 3.9.5 3.9.6 3.9.7 3.9.8 3.9.9 3.9.10 3.9.11 "
-    "3.9.12 3.9.13 3.9.14 3.9.14 3.9.15 3.9.16 3.9.17 3.9.18 3.9.19 3.9.10pypy 3.9.11pypy 3.9.12pypy "
-    "3.9.15pypy 3.9.16pypy 3.9.0b5+ 3.9.17 3.9.18",
-    "3.9.0beta5",
+# fmt: off
+_MAGIC_TABLE = (
+    # magic, canonic version number
+    (39170, "1.0"),
+    (39171, "1.1"),  # covers 1.2 as well
+    (11913, "1.3"),
+    (5892, "1.4"),
+
+    # 1.5, 1.5.1, 1.5.2
+    (20121, "1.5"),  # 1.5.1, 1.5.2
+    (50428, "1.6"),  # 1.6
+
+    (50823, "2.0"),  # 2.0, 2.0.1
+    (60202, "2.1"),  # 2.1, 2.1.1, 2.1.2
+    (60717, "2.2"),  # 2.2
+
+    # Two magics one version!
+    (62011, "2.3a0"),
+    (62021, "2.3a0"),  # two distinct magics for the same release
+
+    (62041, "2.4a0"),
+    (62051, "2.4a3"),
+    (62061, "2.4b1"),
+    (62071, "2.5a0"),
+    (62081, "2.5a0"),  # ast-branch
+    (62091, "2.5a0"),  # with
+    (62092, "2.5a0"),  # changed WITH_CLEANUP opcode
+    (62101, "2.5b3"),  # fix wrong code: for x, in ...
+    (62111, "2.5b3"),  # fix wrong code: x += yield
+
+    # Fix wrong lnotab with for loops and storing constants that should
+    # have been removed
+    (62121, "2.5c1"),
+
+    # Fix wrong code: "for x, in ..." in listcomp/genexp
+    (62131, "2.5c2"),
+
+    # Dropbox-modified Python 2.5 used in versions 1.1x and before of Dropbox
+    (62135, "2.5dropbox"),
+
+    (62151, "2.6a0"),  # peephole optimizations & STORE_MAP
+    (62161, "2.6a1"),  # WITH_CLEANUP optimization
+
+    # Optimize list comprehensions/change LIST_APPEND
+    (62171, "2.7a0"),
+
+    # Optimize conditional branches: introduce POP_JUMP_IF_FALSE and
+    # POP_JUMP_IF_TRUE
+    (62181, "2.7a0+1"),
+
+    (62191, "2.7a0+2"),  # introduce SETUP_WITH
+    (62201, "2.7a0+3"),  # introduce BUILD_SET
+    (62211, "2.7"),  # introduce MAP_ADD and SET_ADD
+
+    (2657, "2.7pyston-0.6.1"),
+
+    # PyPy including pypy-2.6.1, pypy-5.0.1 PyPy adds 7 to the corresponding CPython number
+    (62211 + 7, "2.7pypy"),
+
+    (3000, "3.000"),
+    (3010, "3.000+1"),  # removed UNARY_CONVERT
+    (3020, "3.000+2"),  # added BUILD_SET
+    (3030, "3.000+3"),  # added keyword-only parameters
+    (3040, "3.000+4"),  # added signature annotations
+    (3050, "3.000+5"),  # print becomes a function
+    (3060, "3.000+6"),  # PEP 3115 metaclass syntax
+    (3061, "3.000+7"),  # string literals become unicode
+    (3071, "3.000+8"),  # PEP 3109 raise changes
+    (3081, "3.000+9"),  # PEP 3137 make __file__ and __name__ unicode
+    (3091, "3.000+10"),  # kill str8 interning
+    (3101, "3.000+11"),  # merge from 2.6a0, see 62151
+    (3103, "3.000+12"),  # __file__ points to source file
+    (3111, "3.0a4"),  # WITH_CLEANUP optimization
+    (3131, "3.0a5"),  # lexical exception stacking, including POP_EXCEPT
+    (3141, "3.1a0"),  # optimize list, set and dict comprehensions
+    (3151, "3.1a0+"),  # optimize conditional branches
+    (3160, "3.2a0"),  # add SETUP_WITH
+    (3170, "3.2a1"),  # add DUP_TOP_TWO, remove DUP_TOPX and ROT_FOUR
+    (3180, "3.2a2"),  # 3.2a2 (add DELETE_DEREF)
+
+    # Python 3.2.5 - PyPy 2.3.4 PyPy adds 7 to the corresponding CPython
+    # number
+    (3180 + 7, "3.2pypy"),
+
+    (3190, "3.3a0"),  # __class__ super closure changed
+    (3200, "3.3a0+"),  # __qualname__ added
+    (3220, "3.3a1"),  # changed PEP 380 implementation
+
+    # Added size modulo 2**32 to the pyc header
+    # NOTE: 3.3a2 is our name, other places call it 3.3
+    # but most 3.3 versions are 3.3a4 which comes next.
+    # FIXME: figure out what the history is and
+    # what the right thing to do if this isn't it.
+    (3210, "3.3a2"),
+    (3230, "3.3a4"),  # revert changes to implicit __class__ closure
+
+    # Evaluate positional default arg keyword-only defaults
+    (3250, "3.4a1"),
+
+    # Add LOAD_CLASSDEREF; allow locals of class to override free vars
+    (3260, "3.4a1+1"),
+
+    (3270, "3.4a1+2"),  # various tweaks to the __class__ closure
+    (3280, "3.4a1+3"),  # remove implicit class argument
+    (3290, "3.4a4"),  # changes to __qualname__ computation
+    (3300, "3.4a4+"),  # more changes to __qualname__ computation
+    (3310, "3.4rc2"),  # alter __qualname__ computation
+    (3320, "3.5a0"),  # matrix multiplication operator
+    (3330, "3.5b1"),  # pep 448: additional unpacking generalizations
+    (3340, "3.5b2"),  # fix dictionary display evaluation order #11205
+    (3350, "3.5"),  # add GET_YIELD_FROM_ITER opcode #24400 (also 3.5b2)
+    (3351, "3.5.2"),  # fix BUILD_MAP_UNPACK_WITH_CALL opcode #27286; 3.5.3, 3.5.4, 3.5.5
+    (3360, "3.6a0"),  # add FORMAT_VALUE opcode #25483
+    (3361, "3.6a0+1"),  # lineno delta of code.co_lnotab becomes signed
+    (3370, "3.6a1"),  # 16 bit wordcode
+    (3371, "3.6a1+1"),  # add BUILD_CONST_KEY_MAP opcode #27140
+    (3372, "3.6a1+2"),  # MAKE_FUNCTION simplification, remove MAKE_CLOSURE #27095
+    (3373, "3.6b1"),  # add BUILD_STRING opcode #27078
+    (3375, "3.6b1+1"),  # add SETUP_ANNOTATIONS and STORE_ANNOTATION opcodes #27985
+    (3376, "3.6b1+2"),  # simplify CALL_FUNCTION* & BUILD_MAP_UNPACK_WITH_CALL
+    (3377, "3.6b1+3"),  # set __class__ cell from type.__new__ #23722
+    (3378, "3.6b2"),  # add BUILD_TUPLE_UNPACK_WITH_CALL #28257
+
+    # more thorough __class__ validation #23722
+    (3379, "3.6rc1"),
+
+    # add LOAD_METHOD and CALL_METHOD opcodes #26110
+    (3390, "3.7.0alpha0"),
+
+    # update GET_AITER #31709
+    (3391, "3.7.0alpha3"),
+
+    # Initial PEP 552 - Deterministic pycs #31650
+    # Additional word in header and possibly no timestamp
+    (3392, "3.7.0beta2"),
+
+    # Final PEP 552: timestamp + size field or no timestamp + SipHash
+    # remove STORE_ANNOTATION opcode #3255
+    (3393, "3.7.0beta3"),
+
+    # restored docstring as the first stmt in the body; this might
+    # affect the first line number #32911
+    (3394, "3.7.0"),
+
+    # move frame block handling to compiler #17611
+    (3400, "3.8.0a1"),
+
+    # add END_ASYNC_FOR #33041
+    (3401, "3.8.0a3+"),
+
+    # PEP570 Python Positional-Only Parameters #36540
+    (3410, "3.8.0a1+"),
+
+    # Reverse evaluation order of key: value in dict comprehensions
+    # #35224
+    (3411, "3.8.0b2+"),
+
+    # Swap the position of positional args and positional only args in
+    # ast.arguments #37593
+    (3412, "3.8.0beta2"),
+
+    # Fix "break" and "continue" in "finally" #37830
+    (3413, "3.8.0rc1+"),
+
+    # add LOAD_ASSERTION_ERROR #34880
+    (3420, "3.9.0a0"),
+
+    # simplified bytecode for with blocks #32949
+    (3421, "3.9.0a0"),
+
+    # Remove BEGIN_FINALLY, END_FINALLY, CALL_FINALLY, POP_FINALLY bytecodes #33387
+    (3422, "3.9.0alpha1"),
+
+    # add IS_OP, CONTAINS_OP and JUMP_IF_NOT_EXC_MATCH bytecodes #39156
+    (3423, "3.9.0a0"),
+
+    # simplify bytecodes for *value unpacking
+    (3424, "3.9.0a2"),
+
+    # simplify bytecodes for **value unpacking
+    (3425, "3.9.0beta5"),
+
+    # Make 'annotations' future by default
+    (3430, "3.10a1"),
+
+    # New line number table format -- PEP 626
+    (3431, "3.10a1"),
+
+    # Function annotation for MAKE_FUNCTION is changed from dict to tuple bpo-42202
+    (3432, "3.10a2"),
+
+    # RERAISE restores f_lasti if oparg != 0
+    (3433, "3.10a2"),
+    (3434, "3.10a6"),
+    (3435, "3.10a7"),
+    (3438, "3.10b1"),
+    (3439, "3.10.0rc2"),
+
+    (3450, "3.11a1a"),
+    (3451, "3.11a1b"),
+    (3452, "3.11a1c"),
+    (3453, "3.11a1d"),
+    (3454, "3.11a1e"),
+    (3455, "3.11a1f"),
+    (3457, "3.11a1g"),
+    (3458, "3.11a1h"),
+    (3459, "3.11a1i"),
+    (3460, "3.11a1j"),
+    (3461, "3.11a1k"),
+    (3462, "3.11a2"),
+    (3463, "3.11a3a"),
+    (3464, "3.11a3b"),
+    (3465, "3.11a4a"),
+    (3466, "3.11a4b"),
+    (3466, "3.11a4c"),
+    (3467, "3.11a4d"),
+    (3468, "3.11a4e"),
+    (3469, "3.11a4f"),
+    (3470, "3.11a4g"),
+    (3471, "3.11a4h"),
+    (3472, "3.11a4i"),
+    (3473, "3.11a4j"),
+    (3474, "3.11a4k"),
+    (3475, "3.11a5a"),
+    (3476, "3.11a5b"),
+    (3477, "3.11a5c"),
+    (3478, "3.11a5d"),
+    (3479, "3.11a5e"),
+    (3480, "3.11a5e"),
+    (3481, "3.11a5f"),
+    (3482, "3.11a5g"),
+    (3483, "3.11a5h"),
+    (3484, "3.11a5i"),
+    (3485, "3.11a5j"),
+    (3486, "3.11a6a"),
+    (3487, "3.11a6b"),
+    (3488, "3.11a6c"),
+    (3489, "3.11a6d"),
+    (3490, "3.11a6d"),
+    (3491, "3.11a7a"),
+    (3492, "3.11a7b"),
+    (3493, "3.11a7c"),
+    (3494, "3.11a7d"),
+    (3495, "3.11a7e"),
+    (3531, "3.12.0rc2"),
+
+    # Weird ones
+    # WTF? Python 3.2.5 and PyPy have weird magic numbers
+
+    (48, "3.2a2"),
+    (64, "3.3pypy"),
+    (112, "3.5pypy"),  # pypy3.5-c-jit-latest
+    (160, "3.6.1pypy"),  # '3.6.1 ... PyPy 7.1.0-beta0'
+    (192, "3.6pypy"),  # '3.6.9 ... PyPy 7.1.0-beta0'
+    (224, "3.7pypy"),  # PyPy 3.7.9-beta0
+    (240, "3.7pypy"),  # PyPy 3.7.9-beta0
+    (256, "3.8pypy"),  # PyPy 3.8.15
+    (336, "3.9pypy"),  # PyPy 3.9.15, PyPy 3.9.17
+    (384, "3.10pypy"),  # PyPy 3.10.12
+
+    # NOTE: This is JVM bytecode not Python bytecode
+    (21150, "3.8.5Graal"),
+
+    # Graal Java 21.0.2
+    (21280, "3.10.8Graal"),
+
+    (1011, "2.7.1b3Jython"),  # jython
+    (22138, "2.7.7Pyston"),  # 2.7.8pyston, pyston-0.6.0
 )
+# fmt: on
 
-add_canonic_versions(
-    "3.10 3.10.0 3.10.1 3.10.2 3.10.3 3.10.4 3.10.5 3.10.6 3.10.7 3.10.8 3.10.9 "
-    "3.10.10 3.10.11 3.10.12 3.10.13 3.10.14",
-    "3.10.0rc2",
-)
+_add_magics(_MAGIC_TABLE)
 
-add_canonic_versions(
-    "3.11 3.11.0 3.11.1 3.11.2 3.11.3 3.11.4 3.11.5 3.11.6 3.11.7 3.11.8 3.11.9",
-    "3.11a7e",
-)
+_magics = __by_version(versions)
+_magics["3.8.12pypy"] = _magics["3.8.0rc1+"]
+_magics["3.9.15pypy"] = _magics["3.9.0alpha1"]
+_magics["3.9.16pypy"] = _magics["3.9.0alpha1"]
 
-add_canonic_versions(
-    "3.12 3.12.0 3.12.1 3.12.2 3.12.3 3.12.4 3.12.5",
-    "3.12.0rc2",
+# From a Python version given in sys.info, e.g. 3.6.1,
+# what is the "canonic" version number, e.g. '3.6.0rc1'
+_canonic_python_version = {}
+
+
+def _add_canonic_versions(canonic_aliases: tuple) -> None:
+    """Map each release version string to its canonic version and magic."""
+    for release_versions, canonic in canonic_aliases:
+        release_versions = list(map(sys.intern, release_versions.split()))
+        _canonic_python_version.update((v, canonic) for v in release_versions)
+        magic = _magics[canonic]
+        _magics.update((v, magic) for v in release_versions)
+
+
+# Release version strings, and the canonic version each one maps to.
+_CANONIC_ALIASES = (
+    ("1.5.1 1.5.2", "1.5"),
+    ("2.0.1", "2.0"),
+    ("2.1.1 2.1.2 2.1.3", "2.1"),
+    ("2.2.3", "2.2"),
+    ("2.3 2.3.7", "2.3a0"),
+    ("2.4 2.4.0 2.4.1 2.4.2 2.4.3 2.4.5 2.4.6", "2.4b1"),
+    ("2.5 2.5.0 2.5.1 2.5.2 2.5.3 2.5.4 2.5.5 2.5.6", "2.5c2"),
+    ("2.6 2.6.6 2.6.7 2.6.8 2.6.9", "2.6a1"),
+    (
+        "2.7.0 2.7.1 2.7.2 2.7.2 2.7.3 2.7.4 2.7.5 2.7.6 2.7.7 "
+        "2.7.8 2.7.9 2.7.10 2.7.11 2.7.12 2.7.13 2.7.14 2.7.15 "
+        "2.7.15candidate1 "
+        "2.7.16 "
+        "2.7.17rc1 2.7.17candidate1 2.7.17 2.7.18 2.7.18candidate1",
+        "2.7",
+    ),
+    ("3.0 3.0.0 3.0.1", "3.0a5"),
+    ("3.1 3.1.0 3.1.1 3.1.2 3.1.3 3.1.4 3.1.5", "3.1a0+"),
+    ("3.2 3.2.0 3.2.1 3.2.2 3.2.3 3.2.4 3.2.5 3.2.6", "3.2a2"),
+    ("3.3 3.3.0 3.3.1 3.3.2 3.3.3 3.3.4 3.3.5 3.3.6 3.3.7rc1 3.3.7", "3.3a4"),
+    (
+        "3.4 3.4.0 3.4.1 3.4.2 3.4.3 3.4.4 3.4.5 3.4.6 3.4.7 3.4.8 3.4.9 3.4.10",
+        "3.4rc2",
+    ),
+    ("3.5 3.5.0 3.5.1", "3.5"),
+    ("3.5.2 3.5.3 3.5.4 3.5.5 3.5.6 3.5.7 3.5.8 3.5.9 " "3.5.10", "3.5.2"),
+    (
+        "3.6b2 3.6 3.6.0 3.6.1 3.6.2 3.6.3 3.6.4 3.6.5 3.6.6 3.6.7 3.6.8 "
+        "3.6.9 3.6.10 3.6.11 3.6.12 3.6.13 3.6.14 3.6.15",
+        "3.6rc1",
+    ),
+    ("3.7b1", "3.7.0beta3"),
+    ("3.8a1", "3.8.0beta2"),
+    ("2.7.10pypy 2.7.12pypy 2.7.13pypy 2.7.18pypy", "2.7pypy"),
+    ("2.7.3b0Jython", "2.7.1b3Jython"),
+    ("3.8.5Graal", "3.8.5Graal"),
+    ("3.8.10Graal", "3.8.0rc1+"),
+    ("3.2.5pypy", "3.2pypy"),
+    ("3.3.5pypy", "3.3pypy"),
+    ("3.5.3pypy", "3.5pypy"),
+    ("3.6.9pypy", "3.6pypy"),
+    ("3.7.0pypy 3.7.9pypy 3.7.10pypy 3.7.12pypy 3.7.13pypy", "3.7pypy"),
+    ("3.8.0pypy 3.8.12pypy 3.8.13pypy 3.8.15pypy", "3.8.12pypy"),
+    ("3.8.16pypy", "3.8pypy"),
+    ("3.9.17pypy 3.9.18pypy", "3.9pypy"),
+    ("3.10.12pypy 3.10.13pypy 3.10pypy", "3.10pypy"),
+    ("2.7.8Pyston", "2.7.7Pyston"),
+    ("3.7.0alpha3", "3.7.0alpha3"),
+    (
+        "3.7 3.7.0beta5 3.7.1 3.7.2 3.7.3 3.7.4 3.7.5 3.7.6 3.7.7 3.7.8 3.7.9 "
+        "3.7.10 3.7.11 3.7.12 3.7.13 3.7.14 3.7.15 3.7.16 3.7.17",
+        "3.7.0",
+    ),
+    ("3.8.0alpha0 3.8.0alpha3 3.8.0a0", "3.8.0a3+"),
+    (
+        "3.8b4 3.8.0candidate1 3.8 3.8.0 3.8.1 3.8.2 3.8.3 3.8.4 3.8.5 3.8.6 3.8.7 3.8.8 "
+        "3.8.9 3.8.10 3.8.11 3.8.12 3.8.13 3.8.14 3.8.15 3.8.16 3.8.17 3.8.18 3.8.19",
+        "3.8.0rc1+",
+    ),
+    ("3.9 3.9.0 3.9.0a1+ 3.9.0a2+ 3.9.0alpha1 3.9.0alpha2", "3.9.0alpha1"),
+    (
+        "3.9 3.9.0 3.9.1 3.9.2 3.9.3 3.9.4 3.9.5 3.9.6 3.9.7 3.9.8 3.9.9 3.9.10 3.9.11 "
+        "3.9.12 3.9.13 3.9.14 3.9.14 3.9.15 3.9.16 3.9.17 3.9.18 3.9.19 3.9.10pypy 3.9.11pypy 3.9.12pypy "
+        "3.9.15pypy 3.9.16pypy 3.9.0b5+ 3.9.17 3.9.18",
+        "3.9.0beta5",
+    ),
+    (
+        "3.10 3.10.0 3.10.1 3.10.2 3.10.3 3.10.4 3.10.5 3.10.6 3.10.7 3.10.8 3.10.9 "
+        "3.10.10 3.10.11 3.10.12 3.10.13 3.10.14",
+        "3.10.0rc2",
+    ),
+    (
+        "3.11 3.11.0 3.11.1 3.11.2 3.11.3 3.11.4 3.11.5 3.11.6 3.11.7 3.11.8 3.11.9",
+        "3.11a7e",
+    ),
+    (
+        "3.12 3.12.0 3.12.1 3.12.2 3.12.3 3.12.4 3.12.5",
+        "3.12.0rc2",
+    ),
+    ("3.10.13Graal", "3.10.8Graal"),
 )
 
-add_canonic_versions("3.10.13Graal", "3.10.8Graal")
+_add_canonic_versions(_CANONIC_ALIASES)
 
 # The canonic version for a canonic version is itself
-for v in versions.values():
-    canonic_python_version[v] = v
+_canonic_versions = list(dict.fromkeys(versions.values()))
+_canonic_python_version.update(zip(_canonic_versions, _canonic_versions))
 # A set of all Python versions we know about
-python_versions = set(canonic_python_version.keys())
+python_versions = frozenset(_canonic_python_version.keys())
 
-
-def __show(text, magic):
-    print(text, struct.unpack("BBBB", magic), struct.unpack("<HBB", magic))
+# Publish read-only views of the tables built above. Python 3.15 and later
+# have a built-in frozendict, which is used when available.
+_freeze = getattr(builtins, "frozendict", MappingProxyType)
+by_magic: Mapping[bytes, FrozenSet[str]] = _freeze(
+    {m: frozenset(s) for m, s in _by_magic.items()}
+)
+magics: Mapping[str, bytes] = _freeze(_magics)
+canonic_python_version: Mapping[str, str] = _freeze(_canonic_python_version)
 
 
 def magic_int2tuple(magic_int: int) -> tuple:
@@ -537,27 +551,26 @@ def magic_int2tuple(magic_int: int) -> tuple:
     number. For example 3320 (3.5.a0), 3340 (3.5b1)
     all map to 3.5.
     """
-    return py_str2tuple(magicint2version[magic_int])
+    try:
+        return _MAGIC_INT_TUPLE[magic_int]
+    except KeyError:
+        return py_str2tuple(magicint2version[magic_int])
 
 
-def py_str2tuple(orig_version):
-    """Convert a Python version into a tuple number,
-    e.g. (2, 5), (3, 6).
+_RE_SUFFIX = re.compile(r"(pypy|dropbox)$")
+_RE_TRIPLE = re.compile(r"^(\d)\.(\d+)\.(\d+)")
+_RE_AB = re.compile(r"^(\d)\.(\d(\d+)?)[abr]?")
 
-    A runtime error is raised if "version" is not found.
 
-    Note that there can be several strings that map to a single
-    tuple. For example 3.2a1, 3.2.0, 3.2.2, 3.2.6 among others all map
-    to (3, 2).
-    """
-    version = re.sub(r"(pypy|dropbox)$", "", orig_version)
+def _parse_version(orig_version: str) -> tuple:
+    version = _RE_SUFFIX.sub("", orig_version)
     if version in magics:
-        m = re.match(r"^(\d)\.(\d+)\.(\d+)", version)
+        m = _RE_TRIPLE.match(version)
         if m:
             return int(m.group(1)), int(m.group(2)), int(m.group(3))
         else:
             # Match things like 3.5a0, 3.5b2, 3.6a1+1, 3.6rc1, 3.7.0beta3
-            m = re.match(r"^(\d)\.(\d(\d+)?)[abr]?", version)
+            m = _RE_AB.match(version)
             if m:
                 return int(m.group(1)), int(m.group(2))
             pass
@@ -567,12 +580,55 @@ def py_str2tuple(orig_version):
     )
 
 
+def _version_tuples() -> Dict[str, tuple]:
+    version_tuples = {}
+    for version in magics:
+        try:
+            version_tuples[version] = _parse_version(version)
+        except RuntimeError:
+            pass
+    return version_tuples
+
+
+# Version tuples for all the version strings we know about, so that
+# py_str2tuple() on these is just a dictionary lookup.
+_VERSION_TUPLE: Dict[str, tuple] = _version_tuples()
+
+# Likewise for magic_int2tuple(), which is called for every bytecode file
+# loaded.
+_MAGIC_INT_TUPLE: Dict[int, tuple] = {
+    magic_int: _VERSION_TUPLE[version]
+    for magic_int, version in magicint2version.items()
+    if version in _VERSION_TUPLE
+}
+
+
+def py_str2tuple(orig_version):
+    """Convert a Python version into a tuple number,
+    e.g. (2, 5), (3, 6).
+
+    A runtime error is raised if "version" is not found.
+
+    Note that there can be several strings that map to a single
+    tuple. For example 3.2a1, 3.2.0, 3.2.2, 3.2.6 among others all map
+    to (3, 2).
+    """
+    try:
+        return _VERSION_TUPLE[orig_version]
+    except KeyError:
+        return _parse_version(orig_version)
+
+
 def sysinfo2magic(version_info=sys.version_info) -> bytes:
     """Convert a list sys.versions_info compatible list into a 'canonic'
     floating-point number which that can then be used to look up a
     magic number.  Note that this can raise an exception.
     """
+    return _sysinfo2magic(tuple(version_info))
 
+
+@functools.lru_cache(maxsize=None)
+def _sysinfo2magic(version_info: tuple) -> bytes:
     vers_str = version_tuple_to_str(version_info)
     if version_info[3] != "final":
         vers_str += version_tuple_to_str(version_info, start=3)
@@ -582,16 +638,9 @@ def sysinfo2magic(version_info=sys.version_info) -> bytes:
     elif IS_GRAAL:
         vers_str += "Graal"
     else:
-        try:
-            import platform
-
-            platform_str = platform.python_implementation()
-            if platform_str in ("Jython", "Pyston", "GraalVM"):
-                vers_str += platform_str
-                pass
-        except ImportError:
-            # Python may be too old, e.g. < 2.6 or implementation may
-            # just not have platform
+        platform_str = platform.python_implementation()
+        if platform_str in ("Jython", "Pyston", "GraalVM"):
+            vers_str += platform_str
             pass
 
     return magics[vers_str]
@@ -604,7 +653,6 @@ def test():
     print()
     print("This Python interpreter has versions:", magic_current)
     print("Magic code: ", PYTHON_MAGIC_INT)
-    print(type(magic_20), len(magic_20), repr(magic_20))
     assert sysinfo2magic() == MAGIC, (sysinfo2magic(), MAGIC)
 
 
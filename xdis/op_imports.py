@@ -15,7 +15,6 @@
 #  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 """Facilitates for importing Python opcode maps for a given Python version"""
-import copy
 import sys
 
 from xdis.magics import canonic_python_version
@@ -238,21 +237,21 @@ def remap_opcodes(op_obj, alternate_opmap):
         "nofollow",
     ]
 
-    new_opmap = copy.deepcopy(op_obj.opmap)
+    # Opcode tables hold only ints and strings, so shallow copies suffice.
+    new_opmap = op_obj.opmap.copy()
     new_lists = {}
     for list_name in positional_opcode_lists:
         if hasattr(op_obj, list_name):
-            new_lists[list_name] = copy.deepcopy(getattr(op_obj, list_name))
+            new_lists[list_name] = list(getattr(op_obj, list_name))
     for list_name in categorized_opcode_lists:
         if hasattr(op_obj, list_name):
-            new_lists[list_name] = copy.deepcopy(getattr(op_obj, list_name))
+            new_lists[list_name] = list(getattr(op_obj, list_name))
 
     new_frozensets = {}
     for i in dir(op_obj):
         item = getattr(op_obj, i)
         if isinstance(item, frozenset):
-            item = list(item)
-            new_frozensets[i] = copy.deepcopy(item)
+            new_frozensets[i] = list(item)
 
     opcodes_with_args = {}
     for opname, opcode in op_obj.opmap.items():
@@ -313,6 +312,8 @@ def remap_opcodes(op_obj, alternate_opmap):
         if hasattr(op_obj, "JUMP_IF_TRUE") and "JUMP_IF_TRUE" in new_opmap:
             setattr(op_obj, "PJIT", new_opmap["JUMP_IF_TRUE"])
 
+    # finalize_opcodes() leaves opname as a tuple; keep it that way.
+    new_lists["opname"] = tuple(new_lists["opname"])
     for new_list_name, new_list in new_lists.items():
         setattr(op_obj, new_list_name, new_list)
     for new_frozenset_name, new_frozenset in new_frozensets.items():
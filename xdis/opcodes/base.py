@@ -19,7 +19,7 @@ limited by, and somewhat compatible with the corresponding
 Python opcode.py structures
 """
 
-from copy import deepcopy
+import sys
 from typing import Dict, List, Set
 
 from xdis import wordcode
@@ -124,8 +124,8 @@ def init_opdata(loc, from_mod, version_tuple=None, is_pypy=False):
         loc["get_jump_target_maps"] = wordcode.get_jump_target_maps
 
     if from_mod is not None:
-        loc["opmap"] = deepcopy(from_mod.opmap)
-        loc["opname"] = deepcopy(from_mod.opname)
+        loc["opmap"] = from_mod.opmap.copy()
+        loc["opname"] = list(from_mod.opname)
         for field in fields2copy:
             loc[field] = getattr(from_mod, field).copy()
         pass
@@ -269,23 +269,18 @@ def nargs_op(
 def opcode_check(loc):
     """When the version of Python we are running happens
     to have the same opcode set as the opcode we are
-    importing, we perform checks to make sure our opcode
-    set matches exactly.
+    importing, we perform checks to make sure every opcode
+    that Python has matches ours. Opcodes that only xdis knows
+    about, such as some PyPy ones, are allowed.
     """
     if (PYTHON_VERSION_TRIPLE[:2] == loc["python_version"][:2]) and IS_PYPY == loc[
         "is_pypy"
     ]:
-        try:
-            import dis
+        import dis
 
-            opmap = fix_opcode_names(dis.opmap)
-            # print(set(opmap.items()) - set(loc['opmap'].items()))
-            # print(set(loc['opmap'].items()) - set(opmap.items()))
-
-            assert all(item in opmap.items() for item in loc["opmap"].items())
-            assert all(item in loc["opmap"].items() for item in opmap.items())
-        except Exception:
-            pass
+        opmap = fix_opcode_names(dis.opmap)
+        xdis_opmap = {k: v for k, v in loc["opmap"].items() if k in opmap}
+        assert xdis_opmap == opmap, set(opmap.items()) ^ set(xdis_opmap.items())
 
 
 def rm_op(loc, name, op):
@@ -391,9 +386,11 @@ def finalize_opcodes(loc):
 
     loc["opmap"] = fix_opcode_names(loc["opmap"])
 
+    # No opcodes are added or removed after this point.
+    loc["opname"] = tuple(loc["opname"])
+
     # Now add in the attributes into the module
-    for op in loc["opmap"]:
-        loc[op] = loc["opmap"][op]
+    loc.update(loc["opmap"])
     loc["JUMP_OPs"] = frozenset(loc["hasjrel"] + loc["hasjabs"])
     loc["NOFOLLOW"] = frozenset(loc["nofollow"])
     loc["operator_set"] = frozenset(
@@ -404,7 +401,11 @@ def finalize_opcodes(loc):
         | set([op for op in loc["hasnargs"] if op not in loc["nofollow"]])
         | set([op for op in loc["hasvargs"]])
     )
-    opcode_check(loc)
+    # The opcode check is only done in Python's development mode
+    # (python -X dev), since it would otherwise run on every import.
+    # sys.flags.dev_mode was added in Python 3.7.
+    if __debug__ and getattr(sys.flags, "dev_mode", False):
+        opcode_check(loc)
     return
 
 
@@ -414,19 +415,24 @@ def fix_opcode_names(opmap):
     directly as an attribute, e.g. SLICE+3. So we turn that into SLICE_3, so we
     can then use opcode_23.SLICE_3.  Later Python's fix this.
     """
-    return dict([(k.replace("+", "_"), v) for (k, v) in opmap.items()])
+    return {k.replace("+", "_"): v for (k, v) in opmap.items()}
 
 
 def update_pj3(g, loc):
     if loc["version_tuple"] < (3, 11):
-        g.update({"PJIF": loc["opmap"]["POP_JUMP_IF_FALSE"]})
-        g.update({"PJIT": loc["opmap"]["POP_JUMP_IF_TRUE"]})
+        g.update(
+            {
+                "PJIF": loc["opmap"]["POP_JUMP_IF_FALSE"],
+                "PJIT": loc["opmap"]["POP_JUMP_IF_TRUE"],
+            }
+        )
     update_sets(loc)
 
 
 def update_pj2(g, loc):
-    g.update({"PJIF": loc["opmap"]["JUMP_IF_FALSE"]})
-    g.update({"PJIT": loc["opmap"]["JUMP_IF_TRUE"]})
+    g.update(
+        {"PJIF": loc["opmap"]["JUMP_IF_FALSE"], "PJIT": loc["opmap"]["JUMP_IF_TRUE"]}
+    )
     update_sets(loc)
 
 